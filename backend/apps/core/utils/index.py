@@ -261,7 +261,4 @@ def clear_index_cache(index_name: str) -> None:
         return
 
     logger.info("Deleting %d cache keys for pattern: %s", len(keys_to_delete), pattern)
-
-    for key in keys_to_delete:
-        logger.info("Deleting key: %s", key)
-        cache.delete(key)
+    cache.delete_many(keys_to_delete)
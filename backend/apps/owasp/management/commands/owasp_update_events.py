@@ -3,6 +3,7 @@
 import yaml
 from django.core.management.base import BaseCommand
 
+from apps.common.utils import slugify
 from apps.github.utils import get_repository_file_content
 from apps.owasp.models.event import Event
 
@@ -18,11 +19,21 @@ class Command(BaseCommand):
             )
         )
 
+        events_data = [
+            (category["category"], event_data)
+            for category in data
+            for event_data in category["events"]
+        ]
+        # Fetch existing events in a single query instead of one query per event.
+        events = Event.objects.in_bulk(
+            [slugify(event_data["name"]) for _, event_data in events_data],
+            field_name="key",
+        )
+
         Event.bulk_save(
             [
                 event
-                for category in data
-                for event_data in category["events"]
-                if (event := Event.update_data(category["category"], event_data, save=False))
+                for category, event_data in events_data
+                if (event := Event.update_data(category, event_data, events=events, save=False))
             ]
         )
@@ -46,6 +46,12 @@ class Event(BulkSaveModel, TimestampedModel):
         OTHER = "other", "Other"
         PARTNER = "partner", "Partner"
 
+    CATEGORY_MAPPING = {
+        "AppSec Days": Category.APPSEC_DAYS,
+        "Global": Category.GLOBAL,
+        "Partner": Category.PARTNER,
+    }
+
     category = models.CharField(
         verbose_name="Category",
         max_length=11,
@@ -159,12 +165,20 @@ class Event(BulkSaveModel, TimestampedModel):
             return None
 
     @staticmethod
-    def update_data(category, data, *, save: bool = True) -> Event | None:
+    def update_data(
+        category,
+        data,
+        *,
+        events: dict[str, Event] | None = None,
+        save: bool = True,
+    ) -> Event | None:
         """Update event data.
 
         Args:
             category (str): The category of the event.
             data (dict): A dictionary containing event data.
+            events (dict, optional): Prefetched existing events keyed by event key.
+                If provided, it is used instead of querying the database.
             save (bool, optional): Whether to save the event instance.
 
         Returns:
@@ -172,10 +186,13 @@ class Event(BulkSaveModel, TimestampedModel):
 
         """
         key = slugify(data["name"])
-        try:
-            event = Event.objects.get(key=key)
-        except Event.DoesNotExist:
-            event = Event(key=key)
+        if events is not None:
+            event = events.get(key) or Event(key=key)
+        else:
+            try:
+                event = Event.objects.get(key=key)
+            except Event.DoesNotExist:
+                event = Event(key=key)
 
         try:
             event.from_dict(category, data)
@@ -200,11 +217,7 @@ class Event(BulkSaveModel, TimestampedModel):
         """
         start_date = data["start-date"]
         fields = {
-            "category": {
-                "AppSec Days": Event.Category.APPSEC_DAYS,
-                "Global": Event.Category.GLOBAL,
-                "Partner": Event.Category.PARTNER,
-            }.get(category, Event.Category.OTHER),
+            "category": Event.CATEGORY_MAPPING.get(category, Event.Category.OTHER),
             "description": data.get("optional-text", ""),
             "end_date": Event.parse_dates(data.get("dates", ""), start_date),
             "name": data["name"],
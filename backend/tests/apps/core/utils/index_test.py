@@ -187,7 +187,7 @@ class TestClearIndexCache:
         clear_index_cache("projects")
 
         mock_logger.info.assert_called()
-        mock_cache.delete.assert_not_called()
+        mock_cache.delete_many.assert_not_called()
 
     @patch("apps.core.utils.index.cache")
     @patch("apps.core.utils.index.logger")
@@ -197,4 +197,7 @@ class TestClearIndexCache:
 
         clear_index_cache("projects")
 
-        assert mock_cache.delete.call_count == 2
+        mock_cache.delete_many.assert_called_once_with(
+            ["algolia:projects:1", "algolia:projects:2"]
+        )
+        mock_cache.delete.assert_not_called()
@@ -71,22 +71,29 @@ class TestHandleMethod:
                 call(
                     "Global Events",
                     {"name": "Global AppSec", "url": "https://globalappsec.com"},
+                    events=mock_event.objects.in_bulk.return_value,
                     save=False,
                 ),
                 call(
                     "Regional Events",
                     {"name": "AppSec Conference", "url": "https://appsecconf.org"},
+                    events=mock_event.objects.in_bulk.return_value,
                     save=False,
                 ),
                 call(
                     "Regional Events",
                     {"name": "AppSec EU", "url": "https://appseceu.org"},
+                    events=mock_event.objects.in_bulk.return_value,
                     save=False,
                 ),
             ],
             any_order=True,
         )
 
+        mock_event.objects.in_bulk.assert_called_once_with(
+            ["global-appsec", "appsec-conference", "appsec-eu"],
+            field_name="key",
+        )
         mock_event.bulk_save.assert_called_once_with([mock_event1, mock_event2, mock_event3])
 
     def test_handle_with_filtered_events(self, mock_event, mock_get_content, command):
@@ -256,6 +256,39 @@ class TestEventUpdateData:
             mock_from_dict.assert_called_once()
             mock_save.assert_not_called()
 
+    def test_update_data_with_prefetched_events(self):
+        """Test update_data uses prefetched events instead of querying."""
+        category = "Global"
+        data = {"name": "Existing Event", "start-date": date(2025, 5, 26)}
+        existing_event = Event(key="existing-event")
+
+        with (
+            patch("apps.owasp.models.event.Event.objects.get") as mock_get,
+            patch.object(Event, "from_dict") as mock_from_dict,
+        ):
+            result = Event.update_data(
+                category, data, events={"existing-event": existing_event}, save=False
+            )
+
+            assert result is existing_event
+            mock_get.assert_not_called()
+            mock_from_dict.assert_called_once_with(category, data)
+
+    def test_update_data_with_prefetched_events_new_event(self):
+        """Test update_data creates new event when missing from prefetched events."""
+        category = "Global"
+        data = {"name": "New Event", "start-date": date(2025, 5, 26)}
+
+        with (
+            patch("apps.owasp.models.event.Event.objects.get") as mock_get,
+            patch.object(Event, "from_dict"),
+        ):
+            result = Event.update_data(category, data, events={}, save=False)
+
+            assert result is not None
+            assert result.key == "new-event"
+            mock_get.assert_not_called()
+
 
 class TestEventGeoMethods:
     """Test cases for geo-related methods."""